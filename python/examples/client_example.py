@@ -13,8 +13,8 @@ Run the server_example.py first, then run this client to see the complete flow.
 
 import socket
 import base58
+import logging
 import time
-from typing import Optional
 
 from sv2 import (
     Sv2CodecState,
@@ -24,16 +24,19 @@ from sv2 import (
     SetupConnection,
 )
 
+# Frame-level diagnostics go through a level-guarded logger so the hex
+# conversions are only paid when debug logging is enabled.
+log = logging.getLogger(__name__)
+
+# Use the same authority public key as the server (base58 encoded).
+# The key is constant, so decode it once at import time instead of on every call:
+# extract the 32-byte key according to SV2 spec, skipping the 2-byte version prefix.
+AUTHORITY_PUB_KEY_B58 = "9auqWEzQDVyd2oe1JVGFLMLHZtCo2FFqZwtKA5gd9xbuEu7PH72"
+AUTHORITY_PUB_KEY = base58.b58decode(AUTHORITY_PUB_KEY_B58)[2:34]
+
 def get_authority_public_key() -> bytes:
     """Get authority public key for connecting to the server."""
-    # Use the same authority public key as the server
-    authority_pub_key_b58 = "9auqWEzQDVyd2oe1JVGFLMLHZtCo2FFqZwtKA5gd9xbuEu7PH72"
-    
-    # Decode from base58 to bytes and extract 32-byte key according to SV2 spec
-    pub_key_full = base58.b58decode(authority_pub_key_b58)
-    authority_pub_key = pub_key_full[2:34]   # Skip 2-byte version prefix
-    
-    return authority_pub_key
+    return AUTHORITY_PUB_KEY
 
 def perform_handshake(client_socket: socket.socket, initiator: Sv2CodecState) -> bool:
     """
@@ -50,7 +53,8 @@ def perform_handshake(client_socket: socket.socket, initiator: Sv2CodecState) ->
         client_socket.send(step_0_frame)
         
         print(f"✓ Sent step 0 frame: {len(step_0_frame)} bytes")
-        print(f"  Ephemeral key: {step_0_frame.hex()[:32]}...")
+        # Slice the bytes before hex-encoding so only the shown prefix is converted
+        log.debug("Ephemeral key: %s...", step_0_frame[:16].hex())
         
         # Step 1: Receive responder's response
         print("Step 1: Waiting for responder's response...")
@@ -80,51 +84,54 @@ def perform_handshake(client_socket: socket.socket, initiator: Sv2CodecState) ->
             print(f"✗ Handshake failed with error: {e}")
         return False
 
-def create_setup_connection_message() -> Optional[Sv2Message]:
+def create_setup_connection_message() -> Sv2Message:
     """Create a SetupConnection message to send to the server."""
-    try:
-        print("\n--- Creating SetupConnection Message ---")
-        
-        setup_connection = SetupConnection(
-            protocol=1,           # Mining protocol
-            min_version=2,        # Minimum protocol version  
-            max_version=2,        # Maximum protocol version
-            flags=0,              # Protocol flags
-            endpoint_host="client.example.com",
-            endpoint_port=0,      # Client doesn't listen
-            vendor="Example Python Client",
-            hardware_version="v1.0.0",
-            firmware="py-client-1.0",
-            device_id="python-client-001"
-        )
-        
-        print("✓ Created SetupConnection message:")
-        print(f"  - Protocol: {setup_connection.protocol}")
-        print(f"  - Version range: {setup_connection.min_version}-{setup_connection.max_version}")
-        print(f"  - Flags: {setup_connection.flags}")
-        print(f"  - Endpoint: {setup_connection.endpoint_host}:{setup_connection.endpoint_port}")
-        print(f"  - Vendor: {setup_connection.vendor}")
-        print(f"  - Hardware Version: {setup_connection.hardware_version}")
-        print(f"  - Firmware: {setup_connection.firmware}")
-        print(f"  - Device ID: {setup_connection.device_id}")
-        
-        # Wrap in Sv2Message enum
-        return Sv2Message.SETUP_CONNECTION(setup_connection)  # type: ignore
-        
-    except Exception as e:  # Catch all exceptions since Sv2MessageError might be a subclass
-        # Check if it's a message error by checking the type name
-        if 'Sv2MessageError' in str(type(e)):
-            print(f"✗ Failed to create SetupConnection message: {e}")
-        else:
-            print(f"✗ Failed to create SetupConnection message: {e}")
-        return None
+    # SetupConnection is a plain record: construction and the enum wrapping
+    # happen entirely in Python and cannot raise, so no try/except is needed
+    # here. Validation happens once, at encode time.
+    print("\n--- Creating SetupConnection Message ---")
+
+    setup_connection = SetupConnection(
+        protocol=1,           # Mining protocol
+        min_version=2,        # Minimum protocol version
+        max_version=2,        # Maximum protocol version
+        flags=0,              # Protocol flags
+        endpoint_host="client.example.com",
+        endpoint_port=0,      # Client doesn't listen
+        vendor="Example Python Client",
+        hardware_version="v1.0.0",
+        firmware="py-client-1.0",
+        device_id="python-client-001"
+    )
 
-def send_and_receive_messages(client_socket: socket.socket, initiator: Sv2CodecState):
+    print("✓ Created SetupConnection message:")
+    log.debug("  - Protocol: %s", setup_connection.protocol)
+    log.debug(
+        "  - Version range: %s-%s",
+        setup_connection.min_version,
+        setup_connection.max_version,
+    )
+    log.debug("  - Flags: %s", setup_connection.flags)
+    log.debug(
+        "  - Endpoint: %s:%s",
+        setup_connection.endpoint_host,
+        setup_connection.endpoint_port,
+    )
+    log.debug("  - Vendor: %s", setup_connection.vendor)
+    log.debug("  - Hardware Version: %s", setup_connection.hardware_version)
+    log.debug("  - Firmware: %s", setup_connection.firmware)
+    log.debug("  - Device ID: %s", setup_connection.device_id)
+
+    # Wrap in Sv2Message enum
+    return Sv2Message.SETUP_CONNECTION(setup_connection)  # type: ignore
+
+def send_and_receive_messages(client_socket: socket.socket, initiator: Sv2CodecState, encoder: Sv2Encoder, decoder: Sv2Decoder):
     """
     Send a SetupConnection message to the server and handle the response.
+
+    The encoder/decoder pair is created once per connection by the caller and
+    reused for every message, so their internal buffers are allocated once.
     """
-    encoder = Sv2Encoder()
-    decoder = Sv2Decoder()
     print("\n--- Message Exchange Phase ---")
     
     # Buffer to accumulate incoming data
@@ -133,15 +140,12 @@ def send_and_receive_messages(client_socket: socket.socket, initiator: Sv2CodecS
     try:
         # Create and send SetupConnection message
         setup_message = create_setup_connection_message()
-        if not setup_message:
-            print("✗ Failed to create SetupConnection message")
-            return
-        
+
         print("\n--- Encoding and Sending Message ---")
         try:
             encoded_frame = encoder.encode(setup_message, initiator)  # type: ignore
             print(f"✓ Message encoded successfully: {len(encoded_frame)} bytes")
-            print(f"  Encoded frame: {encoded_frame.hex()[:64]}...")
+            log.debug("Encoded frame: %s...", encoded_frame[:32].hex())
             
             client_socket.send(encoded_frame)
             print("✓ SetupConnection message sent to server")
@@ -263,16 +267,21 @@ def connect_to_server(host: str = "127.0.0.1", port: int = 34254) -> bool:
         
         # Get authority public key
         authority_pub_key = get_authority_public_key()
-        print(f"✓ Using authority public key: {authority_pub_key.hex()[:16]}...")
+        print(f"✓ Using authority public key: {authority_pub_key[:8].hex()}...")
         
         # Create initiator
         initiator = Sv2CodecState.new_initiator(authority_pub_key)
         print("✓ Initiator created successfully")
-        
+
+        # Create single encoder/decoder pair for the entire session
+        encoder = Sv2Encoder()
+        decoder = Sv2Decoder()
+        print("✓ Encoder and decoder created successfully")
+
         # Perform handshake
         if perform_handshake(client_socket, initiator):
             # Send messages and handle responses after successful handshake
-            send_and_receive_messages(client_socket, initiator)
+            send_and_receive_messages(client_socket, initiator, encoder, decoder)
         else:
             print("✗ Handshake failed, closing connection")
             return False
@@ -309,6 +318,9 @@ def main():
     """
     Main function to demonstrate client functionality.
     """
+    # Switch to logging.DEBUG to see frame-level diagnostics (hex dumps etc.)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("=" * 60)
     print("        Stratum v2 Client Example")
     print("=" * 60)
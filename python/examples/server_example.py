@@ -25,21 +25,18 @@ from sv2 import (
     SetupConnectionSuccess,
 )
 
+# Use actual Stratum v2 keys (base58 encoded) - matching the example.py
+# The keys are constant, so decode them once at import time and extract the
+# 32-byte keys according to SV2 specification (skip 2-byte version prefix on
+# the public key, take the first 32 bytes of the private key).
+AUTHORITY_PUB_KEY_B58 = "9auqWEzQDVyd2oe1JVGFLMLHZtCo2FFqZwtKA5gd9xbuEu7PH72"
+AUTHORITY_PRIV_KEY_B58 = "mkDLTBBRxdBv998612qipDYoTK3YUrqLe8uWw7gu3iXbSrn2n"
+AUTHORITY_PUB_KEY = base58.b58decode(AUTHORITY_PUB_KEY_B58)[2:34]
+AUTHORITY_PRIV_KEY = base58.b58decode(AUTHORITY_PRIV_KEY_B58)[:32]
+
 def get_authority_keypair() -> tuple[bytes, bytes]:
     """Get authority keypair for the server."""
-    # Use actual Stratum v2 keys (base58 encoded) - matching the example.py
-    authority_pub_key_b58 = "9auqWEzQDVyd2oe1JVGFLMLHZtCo2FFqZwtKA5gd9xbuEu7PH72"
-    authority_priv_key_b58 = "mkDLTBBRxdBv998612qipDYoTK3YUrqLe8uWw7gu3iXbSrn2n"
-    
-    # Decode from base58 to bytes and extract 32-byte keys according to SV2 spec
-    pub_key_full = base58.b58decode(authority_pub_key_b58)
-    priv_key_full = base58.b58decode(authority_priv_key_b58)
-    
-    # Extract the 32-byte keys according to SV2 specification
-    authority_pub_key = pub_key_full[2:34]   # Skip 2-byte version prefix
-    authority_priv_key = priv_key_full[:32]  # First 32 bytes
-    
-    return authority_pub_key, authority_priv_key
+    return AUTHORITY_PUB_KEY, AUTHORITY_PRIV_KEY
 
 def perform_handshake(client_socket: socket.socket, responder: Sv2CodecState) -> bool:
     """
@@ -59,7 +56,7 @@ def perform_handshake(client_socket: socket.socket, responder: Sv2CodecState) ->
             return False
             
         print(f"✓ Received step 0 frame: {len(step_0_data)} bytes")
-        print(f"  Ephemeral key: {step_0_data.hex()[:32]}...")
+        print(f"  Ephemeral key: {step_0_data[:16].hex()}...")
         
         # Step 2: Process initiator frame and send response
         print("Step 2: Processing initiator frame and sending response...")
@@ -217,7 +214,7 @@ def handle_decoded_message(decoded_message, encoder, responder, client_socket, m
             encoded_response = encoder.encode(success_message, responder)  # type: ignore
             client_socket.send(encoded_response)
             print(f"✓ Sent SetupConnectionSuccess response: {len(encoded_response)} bytes")
-            print(f"  Response data: {encoded_response.hex()[:64]}...")
+            print(f"  Response data: {encoded_response[:32].hex()}...")
             
         except Exception as e:
             print(f"✗ Failed to encode/send response: {e}")
@@ -235,8 +232,8 @@ def handle_client(client_socket: socket.socket, client_address: tuple):
         # Get authority keypair
         authority_pub_key, authority_priv_key = get_authority_keypair()
         print(f"✓ Using authority keys:")
-        print(f"  Public key: {authority_pub_key.hex()[:16]}...")
-        print(f"  Private key: {authority_priv_key.hex()[:16]}...")
+        print(f"  Public key: {authority_pub_key[:8].hex()}...")
+        print(f"  Private key: {authority_priv_key[:8].hex()}...")
         
         # Create responder
         cert_validity_secs = 86400  # 24 hours
@@ -11,10 +11,14 @@ This example demonstrates how to create a TCP client that:
 6. Prints all messages it receives
 """
 
+import argparse
+import os
 import socket
 import base58
+import logging
 
 from sv2 import (
+    Sv2CodecError,
     Sv2CodecState,
     Sv2Decoder,
     Sv2Encoder,
@@ -23,6 +27,15 @@ from sv2 import (
     CoinbaseOutputConstraints,
 )
 
+# Frame-level diagnostics go through a level-guarded logger so whole-frame
+# hex conversions are only paid when debug logging is enabled.
+log = logging.getLogger(__name__)
+
+# Addresses already resolved by get_server_ip, keyed by the entered hostname.
+# connect_to_server reuses these so DNS is not queried a second time, and the
+# socket family follows the resolution (IPv6 hosts work transparently).
+_resolved_addrs: dict = {}
+
 def get_server_ip() -> str:
     """Get template distribution server IP address from user input."""
     print("\n--- Template Distribution Server IP ---")
@@ -45,9 +58,12 @@ def get_server_ip() -> str:
                 print("✗ Server IP/hostname too long. Please try again.")
                 continue
             
-            # Try to resolve the hostname to validate it
+            # Try to resolve the hostname to validate it, caching the result
+            # so connect_to_server does not resolve it again
             try:
-                socket.gethostbyname(server_ip)
+                addrs = socket.getaddrinfo(server_ip, None, type=socket.SOCK_STREAM)
+                family, _, _, _, sockaddr = addrs[0]
+                _resolved_addrs[server_ip] = (family, sockaddr[0])
                 print(f"✓ Server IP/hostname accepted: {server_ip}")
                 return server_ip
             except socket.gaierror:
@@ -98,6 +114,19 @@ def get_server_port() -> int:
             print(f"✗ Error: {e}")
             continue
 
+def decode_authority_public_key(authority_pub_key_b58: str) -> bytes:
+    """Decode a base58 authority public key per the SV2 spec.
+
+    Strips the 2-byte version prefix and returns the 32-byte key; raises
+    ValueError if the decoded key is too short.
+    """
+    pub_key_full = base58.b58decode(authority_pub_key_b58)
+    if len(pub_key_full) < 34:
+        raise ValueError(
+            f"invalid key length: {len(pub_key_full)} bytes (expected at least 34 bytes)"
+        )
+    return pub_key_full[2:34]   # Skip 2-byte version prefix
+
 def get_authority_public_key() -> bytes:
     """Get authority public key for connecting to the server."""
     print("\n--- Authority Public Key Required ---")
@@ -113,17 +142,14 @@ def get_authority_public_key() -> bytes:
                 continue
             
             # Decode from base58 to bytes and extract 32-byte key according to SV2 spec
-            pub_key_full = base58.b58decode(authority_pub_key_b58)
-            
-            # Validate the decoded key length
-            if len(pub_key_full) < 34:
-                print(f"✗ Invalid key length: {len(pub_key_full)} bytes (expected at least 34 bytes)")
+            try:
+                authority_pub_key = decode_authority_public_key(authority_pub_key_b58)
+            except ValueError as e:
+                print(f"✗ {e}")
                 print("  Please enter a valid base58 encoded authority public key.")
                 continue
             
-            authority_pub_key = pub_key_full[2:34]   # Skip 2-byte version prefix
-            
-            print(f"✓ Authority public key accepted: {authority_pub_key.hex()[:16]}...")
+            print(f"✓ Authority public key accepted: {authority_pub_key[:8].hex()}...")
             return authority_pub_key
             
         except Exception as e:
@@ -131,6 +157,31 @@ def get_authority_public_key() -> bytes:
             print("  Please enter a valid base58 encoded authority public key.")
             continue
 
+# Size of the responder's step 1 handshake frame per the SV2 Noise spec:
+# ephemeral public key + encrypted static key + encrypted certificate signature
+STEP_1_FRAME_SIZE = 234
+
+def recv_exact(client_socket: socket.socket, nbytes: int, scratch: bytearray):
+    """
+    Read exactly nbytes from the socket into a reusable scratch buffer.
+
+    Uses recv_into so no per-call bytes object is allocated while filling;
+    only the final frame copy passed to the decoder is allocated. Returns the
+    received bytes, or None if the peer closed the connection mid-read.
+    """
+    if len(scratch) < nbytes:
+        scratch.extend(bytes(nbytes - len(scratch)))
+
+    view = memoryview(scratch)
+    filled = 0
+    while filled < nbytes:
+        received = client_socket.recv_into(view[filled:nbytes], nbytes - filled)
+        if received == 0:
+            return None
+        filled += received
+
+    return bytes(view[:nbytes])
+
 def perform_handshake(client_socket: socket.socket, initiator: Sv2CodecState) -> bool:
     """
     Perform the 3-step Noise_NX handshake as initiator.
@@ -143,16 +194,18 @@ def perform_handshake(client_socket: socket.socket, initiator: Sv2CodecState) ->
         # Step 0: Send initiator's ephemeral public key
         print("Step 0: Sending ephemeral public key...")
         step_0_frame = initiator.step_0()
-        client_socket.send(step_0_frame)
+        client_socket.sendall(step_0_frame)
         
         print(f"✓ Sent step 0 frame: {len(step_0_frame)} bytes")
-        print(f"  Ephemeral key: {step_0_frame.hex()[:32]}...")
+        print(f"  Ephemeral key: {step_0_frame[:16].hex()}...")
         
-        # Step 1: Receive responder's response
+        # Step 1: Receive responder's response. The frame has a fixed size, so
+        # read exactly that many bytes instead of hoping one recv(4096) call
+        # happens to return a whole frame (TCP gives no such guarantee)
         print("Step 1: Waiting for responder's response...")
-        step_1_data = client_socket.recv(4096)  # Receive responder's frame
-        
-        if not step_1_data:
+        step_1_data = recv_exact(client_socket, STEP_1_FRAME_SIZE, bytearray(STEP_1_FRAME_SIZE))
+
+        if step_1_data is None:
             print("✗ No response received from responder")
             return False
             
@@ -240,16 +293,16 @@ def send_setup_connection_and_coinbase_output_constraints_messages(client_socket
         try:
             setup_encoded_frame = encoder.encode(setup_message, initiator)  # type: ignore
             print(f"✓ SetupConnection encoded successfully: {len(setup_encoded_frame)} bytes")
-            print(f"  Encoded frame: {setup_encoded_frame.hex()[:64]}...")
+            log.debug("Encoded frame: %s...", setup_encoded_frame[:32].hex())
             
-            client_socket.send(setup_encoded_frame)
+            client_socket.sendall(setup_encoded_frame)
             print("✓ SetupConnection message sent to server")
             
             # Print message details
             print("\n--- SetupConnection Message Details ---")
             print(f"Message Type: SetupConnection")
             print(f"Message Size: {len(setup_encoded_frame)} bytes")
-            print(f"Encoded Data: {setup_encoded_frame.hex()}")
+            log.debug("Encoded data: %s", setup_encoded_frame.hex())
             
         except Exception as e:
             print(f"✗ Failed to encode/send SetupConnection message: {e}")
@@ -258,29 +311,25 @@ def send_setup_connection_and_coinbase_output_constraints_messages(client_socket
         # Wait for SetupConnectionSuccess response
         print("\n--- Waiting for SetupConnectionSuccess Response ---")
         try:
+            # Reusable receive buffer: recv_exact fills it in place, so the
+            # bytes += accumulation of a plain recv() loop (and its quadratic
+            # copying on partial reads) is avoided.
+            scratch = bytearray(4096)
+
             while True:
                 # Get the size of buffer that needs to be filled
                 buffer_size = decoder.buffer_size()
                 
                 if buffer_size > 0:
                     # Read exactly the number of bytes the decoder needs
-                    response_data = client_socket.recv(buffer_size)
-                    
-                    if not response_data:
-                        print("⚠ No response received for SetupConnection")
+                    response_data = recv_exact(client_socket, buffer_size, scratch)
+
+                    if response_data is None:
+                        print("⚠ Connection closed while reading response")
                         return
-                    
-                    if len(response_data) != buffer_size:
-                        # For TCP, we might get partial data, so we need to keep reading
-                        while len(response_data) < buffer_size:
-                            more_data = client_socket.recv(buffer_size - len(response_data))
-                            if not more_data:
-                                print("⚠ Connection closed while reading response")
-                                return
-                            response_data += more_data
-                    
+
                     print(f"✓ Received response: {len(response_data)} bytes")
-                    print(f"  Raw response: {response_data.hex()}")
+                    log.debug("Raw response: %s", response_data.hex())
                     
                     # Try to decode the response
                     try:
@@ -294,18 +343,13 @@ def send_setup_connection_and_coinbase_output_constraints_messages(client_socket
                             # Don't continue if we didn't get the expected response
                             return
                         
-                    except Exception as e:
-                        # Check if it's a MissingBytes error
-                        error_type = type(e).__name__
-                        
-                        # Handle MissingBytes error
-                        if "MissingBytes" in error_type:
-                            # Decoder needs more data, will check buffer_size again
-                            continue
-                        else:
-                            print(f"⚠ Error decoding response: {e}")
-                            print(f"  Raw response data: {response_data.hex()}")
-                            return
+                    except Sv2CodecError.MissingBytes:
+                        # Decoder needs more data, will check buffer_size again
+                        continue
+                    except Sv2CodecError as e:
+                        print(f"⚠ Error decoding response: {e}")
+                        log.debug("Raw response data: %s", response_data.hex())
+                        return
                             
                 else:
                     # If buffer_size is 0, try calling try_decode with empty data to trigger buffer_size calculation
@@ -314,17 +358,12 @@ def send_setup_connection_and_coinbase_output_constraints_messages(client_socket
                         # If this succeeds, we have a message (shouldn't happen on first call)
                         print("✓ Received response (unexpected initial success)")
                         break
-                    except Exception as e:
-                        # Check if it's a MissingBytes error
-                        error_type = type(e).__name__
-                        
-                        # Handle MissingBytes error
-                        if "MissingBytes" in error_type:
-                            # Decoder updated buffer size, will check buffer_size again
-                            continue
-                        else:
-                            print(f"⚠ Error on initial decode: {e}")
-                            return
+                    except Sv2CodecError.MissingBytes:
+                        # Decoder updated buffer size, will check buffer_size again
+                        continue
+                    except Sv2CodecError as e:
+                        print(f"⚠ Error on initial decode: {e}")
+                        return
                 
         except Exception as e:
             print(f"⚠ Error receiving SetupConnection response: {e}")
@@ -344,16 +383,13 @@ def send_setup_connection_and_coinbase_output_constraints_messages(client_socket
             
             constraints_encoded_frame = encoder.encode(constraints_message, initiator)  # type: ignore
             print(f"✓ CoinbaseOutputConstraints encoded successfully: {len(constraints_encoded_frame)} bytes")
-            print(f"  Encoded frame (first 64 chars): {constraints_encoded_frame.hex()[:64]}...")
+            log.debug("Encoded frame: %s...", constraints_encoded_frame[:32].hex())
             
-            # Send with explicit flush
-            client_socket.send(constraints_encoded_frame)
+            client_socket.sendall(constraints_encoded_frame)
             print("✓ CoinbaseOutputConstraints message sent to server")
             
-        except Exception as e:
-            print(f"✗ Failed to encode/send CoinbaseOutputConstraints message: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("✗ Failed to encode/send CoinbaseOutputConstraints message")
             return
         
     except Exception as e:
@@ -376,82 +412,82 @@ def listen_for_messages(client_socket: socket.socket, initiator: Sv2CodecState,
     
     try:
         message_count = 0
-        
+
+        # Reusable receive buffer: recv_exact fills it in place, so the per-recv
+        # bytes allocations of a plain recv() loop are avoided.
+        scratch = bytearray(4096)
+
         print("\n🔄 Entering message listening loop...")
         while True:
             try:
                 # Get the size of buffer that needs to be filled
                 buffer_size = decoder.buffer_size()
-                
+
                 if buffer_size > 0:
-                    
+
                     # Read exactly the number of bytes the decoder needs
-                    data = client_socket.recv(buffer_size)
-                    
-                    if not data:
+                    data = recv_exact(client_socket, buffer_size, scratch)
+
+                    if data is None:
                         print("✗ Server closed the connection (received empty data)")
                         print("  This might be normal behavior after sending CoinbaseOutputConstraints")
                         break
-                    
-                    if len(data) != buffer_size:
-                        print(f"⚠ Expected {buffer_size} bytes, got {len(data)} bytes")
-                        # For TCP, we might get partial data, so we need to keep reading
-                        while len(data) < buffer_size:
-                            more_data = client_socket.recv(buffer_size - len(data))
-                            if not more_data:
-                                print("✗ Server closed connection while reading")
-                                return
-                            data += more_data
-                    
+
                     # Try to decode with the exact amount of data
                     try:
                         decoded_message = decoder.try_decode(data, initiator)
                         
                         # Successfully decoded a message!
                         message_count += 1
+                        msg_type_name = type(decoded_message).__name__
                         print(f"\n--- Message #{message_count} Decoded ---")
                         print(f"Frame length: {len(data)} bytes")
-                        print(f"Message type: {type(decoded_message).__name__}")
+                        print(f"Message type: {msg_type_name}")
                         
-                        # Print message details
+                        # Print message details. Each report is built as a
+                        # list of lines and emitted with a single print, so a
+                        # template with a deep merkle path costs one stdout
+                        # write instead of one per field/node.
                         if decoded_message.is_NEW_TEMPLATE():
-                            print("📄 NEW_TEMPLATE message received")
                             # Access message data properly from the enum variant
                             template_data = decoded_message.message
-                            print(f"  - Template ID: {template_data.template_id}")
-                            print(f"  - Future template: {template_data.future_template}")
-                            print(f"  - Version: {template_data.version}")
-                            print(f"  - Coinbase value remaining: {template_data.coinbase_tx_value_remaining}")
-                            print(f"  - Merkle path nodes: {len(template_data.merkle_path)}")
-                            for i, path_node in enumerate(template_data.merkle_path):
-                                print(f"    [{i}]: {path_node[::-1].hex()}")
+                            lines = [
+                                "📄 NEW_TEMPLATE message received",
+                                f"  - Template ID: {template_data.template_id}",
+                                f"  - Future template: {template_data.future_template}",
+                                f"  - Version: {template_data.version}",
+                                f"  - Coinbase value remaining: {template_data.coinbase_tx_value_remaining}",
+                                f"  - Merkle path nodes: {len(template_data.merkle_path)}",
+                            ]
+                            lines.extend(
+                                f"    [{i}]: {path_node[::-1].hex()}"
+                                for i, path_node in enumerate(template_data.merkle_path)
+                            )
+                            print("\n".join(lines))
                             
                         elif decoded_message.is_SET_NEW_PREV_HASH_TEMPLATE_DISTRIBUTION():
-                            print("🔗 SET_NEW_PREV_HASH_TEMPLATE_DISTRIBUTION message received")
                             # Access message data properly from the enum variant
                             prev_hash_data = decoded_message.message
-                            print(f"  - Template ID: {prev_hash_data.template_id}")
-                            print(f"  - PrevHash: {prev_hash_data.prev_hash[::-1].hex()}")
-                            print(f"  - Header timestamp: {prev_hash_data.header_timestamp}")
+                            print(
+                                "🔗 SET_NEW_PREV_HASH_TEMPLATE_DISTRIBUTION message received\n"
+                                f"  - Template ID: {prev_hash_data.template_id}\n"
+                                f"  - PrevHash: {prev_hash_data.prev_hash[::-1].hex()}\n"
+                                f"  - Header timestamp: {prev_hash_data.header_timestamp}"
+                            )
                         
                         else:
-                            print(f"📨 Other message type: {type(decoded_message).__name__}")
+                            print(f"📨 Other message type: {msg_type_name}")
                             # For other message types, we just print the type
                         
                         # Continue to next message
                         continue
                         
-                    except Exception as e:
-                        # Check if it's a MissingBytes error
-                        error_type = type(e).__name__
-                        
-                        # Handle MissingBytes error
-                        if "MissingBytes" in error_type:
-                            # Decoder updated buffer size, will check buffer_size again
-                            continue
-                        else:
-                            print(f"✗ Unexpected decoding error: {e}")
-                            break
+                    except Sv2CodecError.MissingBytes:
+                        # Decoder updated buffer size, will check buffer_size again
+                        continue
+                    except Sv2CodecError as e:
+                        print(f"✗ Unexpected decoding error: {e}")
+                        break
                             
                 else:
                     # If buffer_size is 0, try calling try_decode with empty data to trigger initial calculation
@@ -462,17 +498,12 @@ def listen_for_messages(client_socket: socket.socket, initiator: Sv2CodecState,
                         print(f"\n--- Message #{message_count} Decoded (unexpected) ---")
                         print(f"Message type: {type(decoded_message).__name__}")
                         continue
-                    except Exception as e:
-                        # Check if it's a MissingBytes error
-                        error_type = type(e).__name__
-                        
-                        # Handle MissingBytes error
-                        if "MissingBytes" in error_type:
-                            # Decoder updated buffer size, will check buffer_size again
-                            continue
-                        else:
-                            print(f"✗ Unexpected error on initial decode: {e}")
-                            break
+                    except Sv2CodecError.MissingBytes:
+                        # Decoder updated buffer size, will check buffer_size again
+                        continue
+                    except Sv2CodecError as e:
+                        print(f"✗ Unexpected error on initial decode: {e}")
+                        break
                         
             except Exception as e:
                 print(f"⚠ Error in message loop: {e}")
@@ -487,7 +518,7 @@ def listen_for_messages(client_socket: socket.socket, initiator: Sv2CodecState,
     finally:
         print(f"📊 Total messages received: {message_count}")
 
-def connect_to_server(host: str = "127.0.0.1", port: int = 8442) -> bool:
+def connect_to_server(host: str = "127.0.0.1", port: int = 8442, authority_pub_key: bytes = None) -> bool:
     """
     Connect to the Stratum v2 server and perform complete communication flow.
     """
@@ -495,23 +526,57 @@ def connect_to_server(host: str = "127.0.0.1", port: int = 8442) -> bool:
     print("This example sends a CoinbaseOutputConstraints message")
     
     try:
+        # Reuse the address resolved during input validation (falling back to
+        # resolving here for direct callers) and let the socket family follow it
+        family, resolved_host = _resolved_addrs.get(host, (socket.AF_INET, host))
+
         # Create socket and connect
-        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client_socket = socket.socket(family, socket.SOCK_STREAM)
         client_socket.settimeout(10)  # 10 second timeout for connection
-        
+
+        # Disable Nagle's algorithm: the handshake and setup frames are small,
+        # and Nagle interacting with delayed ACKs can hold each one back
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
         # Enable socket keepalive to prevent connection from closing
         client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        # Tune the keepalive timers where supported (Linux): the defaults
+        # (2h idle, 75s probes x9) would leave a dead template server
+        # undetected for hours; with these values it is caught in about a
+        # minute so the client can reconnect and resume the template flow
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+        if hasattr(socket, "TCP_KEEPCNT"):
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+
+        # Give the kernel room to absorb a burst of back-to-back templates
+        # without stalling the sender; the kernel silently caps the request
+        # at net.core.rmem_max / wmem_max, so asking for more is harmless
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+
+        # Bound the unsent kernel send queue so small control frames are not
+        # stuck behind buffered data; not available on all platforms
+        if hasattr(socket, "TCP_NOTSENT_LOWAT"):
+            try:
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NOTSENT_LOWAT, 16384)
+            except OSError:
+                pass
         
         print(f"Attempting to connect to {host}:{port}...")
-        client_socket.connect((host, port))
+        client_socket.connect((resolved_host, port))
         print(f"✓ Connected to server at {host}:{port}")
         
         # Remove connection timeout after successful connection
         client_socket.settimeout(None)
         
-        # Get authority public key
-        authority_pub_key = get_authority_public_key()
-        print(f"✓ Using authority public key: {authority_pub_key.hex()[:16]}...")
+        # Get authority public key unless the caller already supplied one
+        if authority_pub_key is None:
+            authority_pub_key = get_authority_public_key()
+        print(f"✓ Using authority public key: {authority_pub_key[:8].hex()}...")
         
         # Create initiator
         initiator = Sv2CodecState.new_initiator(authority_pub_key)
@@ -553,15 +618,50 @@ def connect_to_server(host: str = "127.0.0.1", port: int = 8442) -> bool:
         print(f"✗ Unexpected error: {e}")
         return False
 
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options, falling back to SV2_* environment variables.
+
+    Anything not supplied on the command line or the environment is prompted
+    for interactively, so scripted runs (CI, benchmarks) can skip the prompts
+    entirely while manual runs keep the guided flow.
+    """
+    parser = argparse.ArgumentParser(
+        description="Stratum v2 Template Distribution example client"
+    )
+    parser.add_argument(
+        "--host",
+        default=os.environ.get("SV2_HOST"),
+        help="server IP or hostname (default: prompt; env SV2_HOST)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ["SV2_PORT"]) if "SV2_PORT" in os.environ else None,
+        help="server port (default: prompt; env SV2_PORT)",
+    )
+    parser.add_argument(
+        "--authority-key",
+        default=os.environ.get("SV2_AUTH_KEY"),
+        help="authority public key in base58 (default: prompt; env SV2_AUTH_KEY)",
+    )
+    return parser.parse_args()
+
 def main():
-    
+    # Switch to logging.DEBUG to see frame-level diagnostics (hex dumps etc.)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    args = parse_args()
+
     try:
-        # Get server connection details from user
-        server_ip = get_server_ip()
-        server_port = get_server_port()
+        # Get server connection details from flags/env, prompting for the rest
+        server_ip = args.host if args.host else get_server_ip()
+        server_port = args.port if args.port else get_server_port()
+        authority_pub_key = (
+            decode_authority_public_key(args.authority_key) if args.authority_key else None
+        )
         
         # Connect to server and send message
-        success = connect_to_server(server_ip, server_port)
+        success = connect_to_server(server_ip, server_port, authority_pub_key)
         
         if success:
             print("\n🎉 Template Distribution Example completed successfully!")
@@ -572,10 +672,8 @@ def main():
     except KeyboardInterrupt:
         print("\n\n🛑 Example interrupted by user")
         
-    except Exception as e:
-        print(f"\n\n✗ Unexpected error in example: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        log.exception("\n\n✗ Unexpected error in example")
 
 if __name__ == "__main__":
     main()
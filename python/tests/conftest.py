@@ -0,0 +1,87 @@
+"""
+Shared pytest configuration and fixtures for the sv2-uniffi test suite.
+"""
+
+import base58
+import pytest
+
+# test_all.py is the manual runner (python tests/test_all.py), not a test
+# module; collecting it would re-run every test it imports a second time.
+collect_ignore = ["test_all.py"]
+
+# Authority keypair used across the suite (base58 encoded, per the SV2 spec)
+AUTHORITY_PUB_KEY_B58 = "9auqWEzQDVyd2oe1JVGFLMLHZtCo2FFqZwtKA5gd9xbuEu7PH72"
+AUTHORITY_PRIV_KEY_B58 = "mkDLTBBRxdBv998612qipDYoTK3YUrqLe8uWw7gu3iXbSrn2n"
+
+@pytest.fixture(scope="session")
+def handshake_states():
+    """Initiator/responder pair with a completed Noise_NX handshake.
+
+    Session-scoped: the X25519/AEAD handshake runs once per pytest session
+    instead of once per test that needs transport-mode codec states.
+    """
+    from sv2 import Sv2CodecState
+
+    authority_pub_key = base58.b58decode(AUTHORITY_PUB_KEY_B58)[2:34]
+    authority_priv_key = base58.b58decode(AUTHORITY_PRIV_KEY_B58)[:32]
+
+    initiator = Sv2CodecState.new_initiator(authority_pub_key)
+    responder = Sv2CodecState.new_responder(
+        authority_pub_key,
+        authority_priv_key,
+        86400,  # 24 hours cert validity
+    )
+
+    step_0_frame = initiator.step_0()
+    step_1_frame = responder.step_1(step_0_frame)
+    initiator.step_2(step_1_frame)
+
+    return initiator, responder
+
+@pytest.fixture(scope="session")
+def initiator(handshake_states):
+    """Transport-mode initiator codec state."""
+    return handshake_states[0]
+
+@pytest.fixture(scope="session")
+def responder(handshake_states):
+    """Transport-mode responder codec state."""
+    return handshake_states[1]
+
+@pytest.fixture(scope="session")
+def encoder():
+    """Shared Sv2Encoder; its internal buffer is allocated once per session."""
+    from sv2 import Sv2Encoder
+
+    return Sv2Encoder()
+
+@pytest.fixture(scope="session")
+def decoder():
+    """Shared Sv2Decoder.
+
+    The decoder's framing state always returns to the expecting-header phase
+    once a frame has been fully decoded, so reusing it across tests is safe
+    and keeps its receive buffer warm.
+    """
+    from sv2 import Sv2Decoder
+
+    return Sv2Decoder()
+
+@pytest.fixture(scope="session")
+def message():
+    """A SetupConnection message wrapped in the Sv2Message enum."""
+    from sv2 import Sv2Message, SetupConnection
+
+    setup_msg = SetupConnection(
+        protocol=1,
+        min_version=2,
+        max_version=2,
+        flags=0,
+        endpoint_host="test.example.com",
+        endpoint_port=4444,
+        vendor="Test Miner",
+        hardware_version="v1.0",
+        firmware="test-1.0.0",
+        device_id="test-device",
+    )
+    return Sv2Message.SETUP_CONNECTION(setup_msg)
@@ -6,8 +6,8 @@ Runs all tests and provides a summary of results.
 """
 
 from test_import import test_import
-from test_handshake import test_handshake
-from test_message_creation import test_message_creation
+from test_handshake import test_handshake, run_handshake
+from test_message_creation import test_message_creation, create_setup_connection_message
 from test_encoding_decoding import test_encoding_decoding
 from test_error_handling import test_error_handling
 from test_extended_channel_server import test_extended_channel_server
@@ -15,6 +15,25 @@ from test_examples import test_examples
 from test_extranonce_allocator import test_extranonce_allocator
 from test_share_accounting import test_share_accounting
 
+def _run(test_func, *args):
+    """Run one assert-based test, mapping exceptions to a failed result."""
+    try:
+        test_func(*args)
+        return True
+    except Exception as e:
+        print(f"✗ {test_func.__name__} failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def _encoding_decoding_with_setup():
+    """Set up the handshake/message/codec dependencies and run the test."""
+    from sv2 import Sv2Encoder, Sv2Decoder
+
+    initiator, responder = run_handshake()
+    message = create_setup_connection_message()
+    test_encoding_decoding(initiator, responder, message, Sv2Encoder(), Sv2Decoder())
+
 def run_all_tests():
     """Run all tests and report results."""
     print("Running sv2-uniffi Tests")
@@ -24,41 +43,39 @@ def run_all_tests():
     
     # Test 1: Import
     print("\n1. Import Test:")
-    results.append(test_import())
+    results.append(_run(test_import))
     
     # Test 2: Handshake
     print("\n2. Handshake Test:")
-    handshake_success, initiator, responder = test_handshake()
-    results.append(handshake_success)
+    results.append(_run(test_handshake))
     
     # Test 3: Message creation
     print("\n3. Message Creation Test:")
-    message_success, message = test_message_creation()
-    results.append(message_success)
+    results.append(_run(test_message_creation))
     
-    # Test 4: Encoding/decoding (depends on previous tests)
+    # Test 4: Encoding/decoding
     print("\n4. Encoding/Decoding Test:")
-    results.append(test_encoding_decoding(initiator, responder, message))
+    results.append(_run(_encoding_decoding_with_setup))
     
     # Test 5: Error handling
     print("\n5. Error Handling Test:")
-    results.append(test_error_handling())
+    results.append(_run(test_error_handling))
     
     # Test 6: Extended channel server
     print("\n6. Extended Channel Server Test:")
-    results.append(test_extended_channel_server())
+    results.append(_run(test_extended_channel_server))
 
     # Test 7: Extranonce allocator
     print("\n7. Extranonce Allocator Test:")
-    results.append(test_extranonce_allocator())
+    results.append(_run(test_extranonce_allocator))
 
     # Test 8: Share accounting
     print("\n8. Share Accounting Test:")
-    results.append(test_share_accounting())
+    results.append(_run(test_share_accounting))
 
     # Test 9: Self-contained Python examples
     print("\n9. Example Smoke Tests:")
-    results.append(test_examples())
+    results.append(_run(test_examples))
     
     # Summary
     print("\n" + "=" * 40)
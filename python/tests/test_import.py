@@ -19,13 +19,10 @@ def test_import():
             Sv2CodecError,
             Sv2MessageError
         )
-        print("✓ Import test passed")
-        return True
-    except ImportError as e:
-        print(f"✗ Import test failed: {e}")
+    except ImportError:
         print("Make sure you have built the library with: cargo build --release")
-        return False
+        raise
+    print("✓ Import test passed")
 
 if __name__ == "__main__":
-    success = test_import()
-    exit(0 if success else 1)
+    test_import()
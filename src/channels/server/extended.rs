@@ -30,6 +30,13 @@ use crate::messages::{
     Sv2Message,
 };
 
+/// A consistent snapshot of the channel state commonly read together.
+#[derive(uniffi::Record)]
+pub struct Sv2ExtendedChannelState {
+    pub active_job: Option<Arc<Sv2ExtendedJob>>,
+    pub target: Vec<u8>,
+}
+
 #[derive(uniffi::Object)]
 pub struct Sv2ExtendedChannelServer {
     pub inner: Mutex<ExtendedChannel<'static, DefaultJobStore<ExtendedJob<'static>>>>,
@@ -358,6 +365,27 @@ impl Sv2ExtendedChannelServer {
         Ok(target_u256.to_vec())
     }
 
+    /// Returns the active job and current target in a single call.
+    ///
+    /// Callers that need both values get one consistent snapshot taken under
+    /// a single lock instead of issuing two FFI calls.
+    pub fn get_channel_state(
+        &self,
+    ) -> Result<Sv2ExtendedChannelState, Sv2ServerExtendedChannelError> {
+        let channel = self
+            .inner
+            .lock()
+            .map_err(|_| Sv2ServerExtendedChannelError::LockError)?;
+        let active_job = channel
+            .get_active_job()
+            .map(|job| Arc::new(Sv2ExtendedJob::from_inner(job.clone())));
+        let target_u256: U256 = (*channel.get_target()).to_le_bytes().into();
+        Ok(Sv2ExtendedChannelState {
+            active_job,
+            target: target_u256.to_vec(),
+        })
+    }
+
     pub fn get_user_identity(&self) -> Result<String, Sv2ServerExtendedChannelError> {
         let channel = self
             .inner
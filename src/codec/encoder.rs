@@ -69,4 +69,56 @@ impl Sv2Encoder {
         let bytes: &[u8] = frame.as_ref();
         Ok(bytes.to_vec())
     }
+
+    /// encodes a batch of Sv2 messages into frames with a single FFI call.
+    ///
+    /// codec_state must be generated from the handshake process.
+    ///
+    /// Returns one encrypted frame per input message, in order. The encoder
+    /// and codec state are locked once for the whole batch, so per-message
+    /// FFI and locking overhead is amortized across the batch.
+    pub fn encode_many(
+        &self,
+        messages: Vec<Sv2Message>,
+        codec_state: Arc<Sv2CodecState>,
+    ) -> Result<Vec<Vec<u8>>, Sv2CodecError> {
+        let mut inner_encoder = self.inner.lock().map_err(|_| Sv2CodecError::LockError)?;
+
+        let mut inner_state = {
+            let state_guard = codec_state
+                .inner
+                .lock()
+                .map_err(|_| Sv2CodecError::LockError)?;
+            state_guard.clone()
+        };
+
+        let mut frames = Vec::with_capacity(messages.len());
+        for message in messages {
+            let inner_message = sv2_message_to_inner(message)
+                .map_err(|error| Sv2CodecError::Sv2MessagesError { error })?;
+
+            let message_frame: StandardEitherFrame<InnerAnyMessage<'static>> = inner_message
+                .try_into()
+                .map_err(|_| Sv2CodecError::FailedToConvertMessageToFrame)
+                .map(|sv2_frame: StandardSv2Frame<InnerAnyMessage<'static>>| sv2_frame.into())?;
+
+            let frame = inner_encoder
+                .encode(message_frame, &mut inner_state)
+                .map_err(|_| Sv2CodecError::FailedToConvertMessageToFrame)?;
+
+            let bytes: &[u8] = frame.as_ref();
+            frames.push(bytes.to_vec());
+        }
+
+        // Update the original state with changes
+        {
+            let mut state_guard = codec_state
+                .inner
+                .lock()
+                .map_err(|_| Sv2CodecError::LockError)?;
+            *state_guard = inner_state;
+        }
+
+        Ok(frames)
+    }
 }
@@ -3,7 +3,10 @@ use noise_sv2::{
     Initiator, Responder, ELLSWIFT_ENCODING_SIZE, INITIATOR_EXPECTED_HANDSHAKE_MESSAGE_SIZE,
 };
 
-use std::{convert::TryInto, sync::Mutex};
+use std::{
+    convert::TryInto,
+    sync::{Arc, Mutex},
+};
 
 use crate::codec::error::Sv2CodecError;
 
@@ -100,3 +103,40 @@ impl Sv2CodecState {
         }
     }
 }
+
+/// A matched initiator/responder pair with a completed handshake.
+#[derive(uniffi::Record)]
+pub struct Sv2HandshakePair {
+    pub initiator: Arc<Sv2CodecState>,
+    pub responder: Arc<Sv2CodecState>,
+}
+
+/// Runs a complete in-process Noise_NX handshake and returns both codec states
+/// in transport mode.
+///
+/// This is intended for callers that hold both roles in the same process
+/// (tests, benchmarks, loopback setups): it fuses `step_0`/`step_1`/`step_2`
+/// into a single FFI call so no handshake frames are surfaced to the caller.
+/// Real network peers should keep using the individual steps.
+#[uniffi::export]
+pub fn sv2_complete_handshake_pair(
+    authority_pub_key: Vec<u8>,
+    authority_priv_key: Vec<u8>,
+    cert_validity_secs: u64,
+) -> Result<Sv2HandshakePair, Sv2CodecError> {
+    let initiator = Sv2CodecState::new_initiator(authority_pub_key.clone())?;
+    let responder = Sv2CodecState::new_responder(
+        authority_pub_key,
+        authority_priv_key,
+        cert_validity_secs,
+    )?;
+
+    let step_0_frame = initiator.step_0()?;
+    let step_1_frame = responder.step_1(step_0_frame)?;
+    initiator.step_2(step_1_frame)?;
+
+    Ok(Sv2HandshakePair {
+        initiator: Arc::new(initiator),
+        responder: Arc::new(responder),
+    })
+}